@@ -70,6 +70,11 @@ stops sending data."""
 FREQUENCY = 50
 """The frequency at which the IMU sends data packets, this is 50Hz"""
 
+IMU_READ_TIMEOUT_SECONDS = 1 / FREQUENCY
+"""The longest a read from the IMU's serial port will wait for data to arrive. This lets the main
+loop sleep until the Arduino sends bytes instead of spinning, while never waiting for longer than
+the time between two packets."""
+
 # -------------------------------------------------------
 # Logging Configuration
 # -------------------------------------------------------
@@ -83,6 +88,16 @@ STOP_SIGNAL = "STOP"
 """The signal to stop the logging and the apogee prediction process, this will be put in the queue
 to stop the process"""
 
+LOG_FILE_BUFFER_SIZE_BYTES = 64 * 1024  # 64 KiB
+"""The size of the write buffer for the log file. A bigger buffer means fewer, larger writes to the
+SD card instead of a small write every few packets."""
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+"""How often the logger flushes its buffer to the log file. This bounds how much data we can lose
+if the Pi loses power, while still letting us batch writes."""
+LOG_BATCH_SIZE = 10
+"""The number of packets the logger collects before sending them to the logging process all at once.
+At 50Hz this is 0.2 seconds of data."""
+
 
 # Formula for converting number of packets to seconds and vice versa:
 # If N = total number of packets, T = total time in seconds:
@@ -157,6 +172,10 @@ TRANSMISSION_DELAY = 10.0
 RECEIVER_SERIAL_PORT = "/dev/ttyAMA0"
 """The serial port that the XBee is connected to"""
 RECEIVER_BAUD_RATE = 9600
+RECEIVER_READ_TIMEOUT_SECONDS = 0.5
+"""The longest a read from the XBee's serial port will wait for data to arrive. The receiver thread
+sleeps in the read until a message comes in, and this is how often it wakes up to check whether it
+should stop."""
 
 NO_MESSAGE = "No Message Received"
 """The message that the receiver returns when there is no message to return"""
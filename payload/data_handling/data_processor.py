@@ -2,7 +2,6 @@
 
 import numpy as np
 import numpy.typing as npt
-from scipy.spatial.transform import Rotation as R
 
 from payload.constants import (
     ACCEL_DEADBAND_METERS_PER_SECOND_SQUARED,
@@ -10,7 +9,14 @@ from payload.constants import (
 )
 from payload.data_handling.packets.imu_data_packet import IMUDataPacket
 from payload.data_handling.packets.processed_data_packet import ProcessedDataPacket
-from payload.utils import convert_milliseconds_to_seconds, deadband
+from payload.utils import (
+    convert_milliseconds_to_seconds,
+    deadband,
+    normalize_quaternion,
+    quaternion_multiply,
+    rotate_vector,
+    rotation_vector_to_quaternion,
+)
 
 
 class IMUDataProcessor:
@@ -50,7 +56,7 @@ class IMUDataProcessor:
         self._initial_altitude: np.float64 | None = None
         self._current_altitude: np.float64 = np.float64(0.0)
         self._last_data_packet: IMUDataPacket | None = None
-        self._current_orientation_quaternions: R | None = None
+        self._current_orientation_quaternions: tuple[float, float, float, float] | None = None
         self._rotated_acceleration: np.float64 = np.float64(0.0)
         self._data_packet: IMUDataPacket | None = None
         self._time_difference: np.float64 = np.float64(0.0)
@@ -157,26 +163,24 @@ class IMUDataProcessor:
         altitude, and the initial orientation of the rocket. This should
         only be called once, when the first data packets are passed in.
         """
+        data_packet = self._data_packet
+
         # Setting last data packet as this packet makes it so that the time diff
         # automatically becomes 0, and the velocity becomes 0
-        self._last_data_packet = self._data_packet
+        self._last_data_packet = data_packet
 
         # This is us getting the rocket's initial altitude from the first data packets
-        self._initial_altitude = self._data_packet.pressureAlt
-
-        # This is us getting the rocket's initial orientation
-        # Convert initial orientation quaternion array to a scipy Rotation object
-        # This will automatically normalize the quaternion as well:
-        self._current_orientation_quaternions = R.from_quat(
-            np.array(
-                [
-                    self._data_packet.estOrientQuaternionW,
-                    self._data_packet.estOrientQuaternionX,
-                    self._data_packet.estOrientQuaternionY,
-                    self._data_packet.estOrientQuaternionZ,
-                ]
-            ),
-            scalar_first=True,  # This means the order is w, x, y, z.
+        self._initial_altitude = data_packet.pressureAlt
+
+        # This is us getting the rocket's initial orientation, in w, x, y, z order. We normalize
+        # it so that it is a pure rotation:
+        self._current_orientation_quaternions = normalize_quaternion(
+            (
+                data_packet.estOrientQuaternionW,
+                data_packet.estOrientQuaternionX,
+                data_packet.estOrientQuaternionY,
+                data_packet.estOrientQuaternionZ,
+            )
         )
 
     def _calculate_current_altitude(self) -> np.float64:
@@ -195,31 +199,40 @@ class IMUDataProcessor:
         :return: float containing the vertical acceleration
         """
 
-        current_orientation = self._current_orientation_quaternions
-        # Accelerations are in m/s^2
-        x_accel = self._data_packet.estCompensatedAccelX
-        y_accel = self._data_packet.estCompensatedAccelY
-        z_accel = self._data_packet.estCompensatedAccelZ
-        # Angular rates are in rads/s
-        gyro_x = self._data_packet.estAngularRateX
-        gyro_y = self._data_packet.estAngularRateY
-        gyro_z = self._data_packet.estAngularRateZ
-
-        # scipy docs for more info: https://docs.scipy.org/doc/scipy/reference/generated/scipy.spatial.transform.Rotation.html
-        # Calculate the delta quaternion from the angular rates
+        # Look the packet up once, rather than going through self for every field
+        data_packet = self._data_packet
         dt = self._time_difference
-        delta_rotation = R.from_rotvec(np.array([gyro_x * dt, gyro_y * dt, gyro_z * dt]))
+
+        # The quaternion math is done by hand on plain floats. For single 3 and 4 element vectors
+        # this is much faster than creating scipy Rotation objects or numpy arrays every packet.
+        # Calculate the delta quaternion from the angular rates (in rads/s)
+        delta_rotation = rotation_vector_to_quaternion(
+            (
+                data_packet.estAngularRateX * dt,
+                data_packet.estAngularRateY * dt,
+                data_packet.estAngularRateZ * dt,
+            )
+        )
 
         # Update the current orientation by applying the delta rotation
-        current_orientation = current_orientation * delta_rotation
+        current_orientation = quaternion_multiply(
+            self._current_orientation_quaternions, delta_rotation
+        )
 
-        # Rotate the acceleration vector using the updated orientation
-        rotated_accel = current_orientation.apply([x_accel, y_accel, z_accel])
+        # Rotate the acceleration vector (in m/s^2) using the updated orientation
+        rotated_accel = rotate_vector(
+            current_orientation,
+            (
+                data_packet.estCompensatedAccelX,
+                data_packet.estCompensatedAccelY,
+                data_packet.estCompensatedAccelZ,
+            ),
+        )
         # Update the class attribute with the latest quaternion orientation
         self._current_orientation_quaternions = current_orientation
         # Vertical acceleration will always be the 3rd element of the rotated vector,
         # regardless of orientation.
-        return -rotated_accel[2]
+        return np.float64(-rotated_accel[2])
 
     def _calculate_vertical_velocity(self) -> npt.NDArray[np.float64]:
         """
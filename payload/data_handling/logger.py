@@ -2,13 +2,19 @@
 
 import csv
 import multiprocessing
+import os
 import signal
+import time
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, TextIO
 
 from msgspec import to_builtins
 
 from payload.constants import (
+    BUFFER_SIZE_IN_BYTES,
+    LOG_BATCH_SIZE,
+    LOG_FILE_BUFFER_SIZE_BYTES,
+    LOG_FLUSH_INTERVAL_SECONDS,
     MAX_GET_TIMEOUT_SECONDS,
     STOP_SIGNAL,
 )
@@ -18,6 +24,16 @@ from payload.data_handling.packets.logged_data_packet import LoggedDataPacket
 from payload.data_handling.packets.processed_data_packet import ProcessedDataPacket
 from payload.utils import modify_multiprocessing_queue_windows
 
+# faster_fifo doesn't support Windows, so it isn't installed there. When it isn't installed we fall
+# back to multiprocessing.Queue. On the Pi it is built from source when the packages are installed,
+# see the README.
+try:
+    from faster_fifo import Queue
+
+    FASTER_FIFO_AVAILABLE = True
+except ImportError:
+    FASTER_FIFO_AVAILABLE = False
+
 
 class Logger:
     """
@@ -33,6 +49,8 @@ class Logger:
     LOG_BUFFER_STATES = ("StandbyState", "LandedState")
 
     __slots__ = (
+        "_last_state_name",
+        "_log_buffer",
         "_log_counter",
         "_log_process",
         "_log_queue",
@@ -60,6 +78,12 @@ class Logger:
         # Buffer for StandbyState and LandedState
         self._log_counter = 0
 
+        # Packets waiting to be sent to the logging process. We send them in batches, since every
+        # put on the queue has to acquire a lock and notify the other process.
+        self._log_buffer: list[LoggedDataPacket] = []
+        # The state of the last logged packet, so we can send the batch early when it changes
+        self._last_state_name: str | None = None
+
         # Create a new log file with the next number in sequence
         self.log_path = log_dir / f"log_{max_suffix + 1}.csv"
         with self.log_path.open(mode="w", newline="") as file_writer:
@@ -70,10 +94,17 @@ class Logger:
         # the back and pop from front, meaning that things will be logged in the order they were
         # added.
         # Signals (like stop) are sent as strings, but data is sent as dictionaries
-        self._log_queue: multiprocessing.Queue[LoggedDataPacket | Literal["STOP"]] = (
-            multiprocessing.Queue()
+        # faster_fifo's queue is much faster than multiprocessing.Queue, and natively supports
+        # getting and putting many items at once
+        self._log_queue: (
+            multiprocessing.Queue[LoggedDataPacket | Literal["STOP"]]
+            | Queue[LoggedDataPacket | Literal["STOP"]]
         )
-        modify_multiprocessing_queue_windows(self._log_queue)
+        if FASTER_FIFO_AVAILABLE:
+            self._log_queue = Queue(max_size_bytes=BUFFER_SIZE_IN_BYTES)
+        else:
+            self._log_queue = multiprocessing.Queue()
+            modify_multiprocessing_queue_windows(self._log_queue)
 
         # Start the logging process
         self._log_process = multiprocessing.Process(
@@ -146,6 +177,9 @@ class Logger:
         """
         Stops the logging process. It will finish logging the current message and then stop.
         """
+        # Send whatever is left in the buffer, so that we don't lose the last packets
+        if self._log_buffer:
+            self._send_log_buffer()
         self._log_queue.put(STOP_SIGNAL)  # Put the stop signal in the queue
         print("put stop signal in queue")
         # Waits for the process to finish before stopping it
@@ -158,7 +192,12 @@ class Logger:
         processed_data_packet: ProcessedDataPacket,
     ) -> None:
         """
-        Logs the current state and IMU data to the CSV file.
+        Logs the current state and IMU data to the CSV file. Packets are sent to the logging
+        process in batches of LOG_BATCH_SIZE, or straight away when the state changes, so the
+        rows around a transition (like landing) don't wait for the batch to fill up. Until a
+        batch is sent, its packets only live in the main process's memory: if the main process
+        crashes or is killed without stop() being called, up to LOG_BATCH_SIZE - 1 packets are
+        lost.
         :param context_data_packet: The context data packet to log.
         :param imu_data_packet: The IMU data packets to log.
         :param processed_data_packet: The processed data packets to log.
@@ -170,7 +209,20 @@ class Logger:
             processed_data_packet,
         )
 
-        self._log_queue.put(logged_data_packet)
+        self._log_buffer.append(logged_data_packet)
+        state_name = context_data_packet.state_name
+        if len(self._log_buffer) >= LOG_BATCH_SIZE or state_name != self._last_state_name:
+            self._send_log_buffer()
+        self._last_state_name = state_name
+
+    def _send_log_buffer(self) -> None:
+        """
+        Sends the buffered packets to the logging process in one put_many call.
+        """
+        self._log_queue.put_many(self._log_buffer)
+        # We make a new list instead of clearing it, since the queue may not have serialized the
+        # old one yet
+        self._log_buffer = []
 
     # ------------------------ ALL METHODS BELOW RUN IN A SEPARATE PROCESS -------------------------
     @staticmethod
@@ -185,6 +237,17 @@ class Logger:
             for key, value in data.items()
         }
 
+    @staticmethod
+    def _sync_to_disk(file_writer: TextIO) -> None:
+        """
+        Writes everything buffered for the log file to the SD card. Flushing only hands the data
+        to the OS, which can hold it in memory for a while, so we also fsync to make sure the rows
+        survive the Pi losing power.
+        :param file_writer: The open log file.
+        """
+        file_writer.flush()
+        os.fsync(file_writer.fileno())
+
     def _logging_loop(self) -> None:
         """
         The loop that saves data to the logs. It runs in parallel with the main loop.
@@ -194,19 +257,41 @@ class Logger:
 
         # Unfortunately, we need to modify the queue here again because the modifications made in
         # the __init__ are not copied to the new process.
-        modify_multiprocessing_queue_windows(self._log_queue)
+        if not FASTER_FIFO_AVAILABLE:
+            modify_multiprocessing_queue_windows(self._log_queue)
 
-        # Set up the csv logging in the new process
-        with self.log_path.open(mode="a", newline="") as file_writer:
+        # Set up the csv logging in the new process. We give the file a large buffer and flush
+        # it ourselves every so often, rather than writing to the SD card every few packets.
+        with self.log_path.open(
+            mode="a", newline="", buffering=LOG_FILE_BUFFER_SIZE_BYTES
+        ) as file_writer:
             writer = csv.DictWriter(file_writer, fieldnames=list(LoggedDataPacket.__annotations__))
+            last_flush_time = time.monotonic()
             while True:
                 # Get a message from the queue (this will block until a message is available)
                 # Because there's no timeout, it will wait indefinitely until it gets a message.
                 message_fields: list[LoggedDataPacket | Literal["STOP"]] = self._log_queue.get_many(
                     timeout=MAX_GET_TIMEOUT_SECONDS
                 )
-                if STOP_SIGNAL in message_fields:
+                # The stop signal can come in the same batch as packets that were logged right
+                # before it, so we write those out before stopping
+                stop_requested = STOP_SIGNAL in message_fields
+                if stop_requested:
+                    message_fields = message_fields[: message_fields.index(STOP_SIGNAL)]
+
+                # Write the whole batch with one writerows() call, instead of looking up and
+                # calling writerow() once per packet
+                writer.writerows(map(Logger._truncate_floats, message_fields))
+
+                # If the message is the stop signal, make sure everything is on disk and break out
+                # of the loop
+                if stop_requested:
+                    Logger._sync_to_disk(file_writer)
                     return
-                # If the message is the stop signal, break out of the loop
-                for message_field in message_fields:
-                    writer.writerow(Logger._truncate_floats(message_field))
+
+                # Flush the buffered rows to the file periodically, so we don't lose too much data
+                # if the Pi loses power
+                current_time = time.monotonic()
+                if current_time - last_flush_time >= LOG_FLUSH_INTERVAL_SECONDS:
+                    Logger._sync_to_disk(file_writer)
+                    last_flush_time = current_time
@@ -5,7 +5,7 @@ from typing import Literal
 import msgspec
 
 
-class ContextDataPacket(msgspec.Struct):
+class ContextDataPacket(msgspec.Struct, gc=False):
     """
     This data packet keeps data owned by the PayloadContext as well as metadata about the context.
     """
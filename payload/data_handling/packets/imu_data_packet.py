@@ -3,9 +3,11 @@
 import msgspec
 
 
-class IMUDataPacket(msgspec.Struct):
+class IMUDataPacket(msgspec.Struct, gc=False):
     """
-    This class represents all the data we receive from the IMU.
+    This class represents all the data we receive from the IMU. We create one of these for every
+    packet, and they only ever hold numbers, so they can't be part of a reference cycle. That's why
+    we tell msgspec not to have the garbage collector track them (gc=False).
     """
 
     timestamp: int  # In milliseconds
@@ -5,7 +5,7 @@ import time
 
 import serial
 
-from payload.constants import PACKET_BYTE_SIZE, PACKET_START_MARKER
+from payload.constants import IMU_READ_TIMEOUT_SECONDS, PACKET_BYTE_SIZE, PACKET_START_MARKER
 from payload.data_handling.packets.imu_data_packet import IMUDataPacket
 from payload.interfaces.base_imu import BaseIMU
 
@@ -16,7 +16,11 @@ class IMU(BaseIMU):
     Arduino.
     """
 
-    __slots__ = ("_serial", "_port", "_baud_rate")
+    # The layout of a data packet, every field is a little-endian 32 bit float. Compiling this once
+    # means we don't rebuild and look up the format string for every packet.
+    PACKET_STRUCT = struct.Struct("<" + "f" * (PACKET_BYTE_SIZE // 4))
+
+    __slots__ = ("_baud_rate", "_buffer", "_port", "_serial")
 
     def __init__(self, port: str, baud_rate: int) -> None:
         """
@@ -27,9 +31,11 @@ class IMU(BaseIMU):
         self._serial = None
         self._baud_rate = baud_rate
         self._port = port
+        # Bytes read from the serial port that haven't been turned into a data packet yet
+        self._buffer = bytearray()
 
     def start(self):
-        self._serial = serial.Serial(self._port, self._baud_rate, timeout=10)
+        self._serial = serial.Serial(self._port, self._baud_rate, timeout=IMU_READ_TIMEOUT_SECONDS)
 
     def stop(self):
         """stops the IMU process."""
@@ -44,20 +50,37 @@ class IMU(BaseIMU):
         Process the data points in the unpacked packet and puts into an IMUDataPacket.
         :param binary_packet: The serialized data packet containing multiple data points.
         """
-        # Iterate through each data point in the packet.
-        unpacked_data = struct.unpack("<" + "f" * (PACKET_BYTE_SIZE // 4), binary_packet)
-        return IMUDataPacket(*unpacked_data)
+        # Unpack every data point in the packet at once.
+        return IMUDataPacket(*IMU.PACKET_STRUCT.unpack(binary_packet))
 
     def fetch_data(self) -> IMUDataPacket | None:
         """
-        Fetches a data packet from the IMU in a non-blocking manner.
-        It keeps reading until it finds a valid start marker, then returns a full packet.
-        If there is not enough data, it returns None.
+        Fetches a data packet from the IMU. If we don't have a full packet yet, it waits for at
+        most IMU_READ_TIMEOUT_SECONDS for more bytes to arrive. It reads all the bytes that are
+        waiting at once, looks for a start marker in them, and returns the full packet that
+        follows it. If there is not enough data, it returns None.
         """
-        while self._serial.in_waiting >= PACKET_BYTE_SIZE + 1:  # The + 1 is for the start marker
-            # Reads a single byte and checks if it is the start marker
-            byte = self._serial.read(1)
-            if byte == PACKET_START_MARKER:
-                serialized_data_packet = self._serial.read(PACKET_BYTE_SIZE)
-                return IMU._process_packet_data(serialized_data_packet)
-        return None
+        # Read everything that has arrived in one call, instead of one byte at a time. If we
+        # don't have a full packet yet and nothing is waiting, we block in the read for at least
+        # one byte, so the main loop sleeps until the Arduino sends data instead of spinning.
+        if len(self._buffer) <= PACKET_BYTE_SIZE:
+            self._buffer += self._serial.read(self._serial.in_waiting or 1)
+        elif self._serial.in_waiting:
+            self._buffer += self._serial.read(self._serial.in_waiting)
+
+        start_index = self._buffer.find(PACKET_START_MARKER)
+        if start_index == -1:
+            # Nothing we have can be the start of a packet, so throw it away
+            self._buffer.clear()
+            return None
+
+        # Drop anything before the start marker, we can't use it
+        del self._buffer[:start_index]
+
+        # The + 1 is for the start marker
+        if len(self._buffer) < PACKET_BYTE_SIZE + 1:
+            return None
+
+        serialized_data_packet = self._buffer[1 : PACKET_BYTE_SIZE + 1]
+        del self._buffer[: PACKET_BYTE_SIZE + 1]
+        return IMU._process_packet_data(serialized_data_packet)
@@ -2,7 +2,7 @@ import threading
 
 import serial
 
-from payload.constants import NO_MESSAGE
+from payload.constants import NO_MESSAGE, RECEIVER_READ_TIMEOUT_SECONDS
 from payload.interfaces.base_receiver import BaseReceiver
 
 
@@ -40,19 +40,35 @@ class Receiver(BaseReceiver):
     def _listen(self) -> None:
         """Continuously listens for serial input."""
         try:
-            with serial.Serial(self.serial_port, self.baud_rate) as ser:
+            with serial.Serial(
+                self.serial_port, self.baud_rate, timeout=RECEIVER_READ_TIMEOUT_SECONDS
+            ) as ser:
                 print(f"Listening on {self.serial_port} at {self.baud_rate} baud rate...")
+                # Holds the bytes we have read, but that don't make up a full line yet
+                buffer = bytearray()
+                # The raw bytes of the latest message, so we can skip repeated lines without
+                # decoding them
+                latest_line = b""
                 while not self._stop_event.is_set():
-                    if ser.in_waiting > 0:  # Check if data is available
-                        line = ser.readline().decode("utf-8", errors="ignore").strip()
-                        print("got line")
-                        if line:
-                            self._latest_message = line.strip()
+                    # Read everything that is waiting in one call, instead of having pyserial look
+                    # for the newline one byte at a time. If nothing is waiting, we block for at
+                    # least one byte, so the thread sleeps until a message arrives instead of
+                    # spinning on in_waiting. The read timeout lets us still notice the stop event.
+                    data = ser.read(ser.in_waiting or 1)
+                    if not data:
+                        continue
+                    buffer += data
+                    *lines, buffer = buffer.split(b"\n")
+                    for raw_line in lines:
+                        line = raw_line.strip()
+                        # The same message can arrive many times in a row, so we only decode and
+                        # print it when the message changes, instead of on every line
+                        if line and line != latest_line:
+                            latest_line = line
+                            self._latest_message = line.decode("utf-8", errors="ignore")
                             print(f"Received: {self._latest_message}")
                 print("exitted while loop")
         except serial.SerialException as e:
             print(f"Error: {e}")
-        except Exception as e:
-            print(f"Unexpected error: {e}")
         finally:
             print("Stopped listening.")
@@ -15,6 +15,10 @@ class Transmitter:
     to our ground station.
     """
 
+    # Matches the comment field of the PBEACON line in the Direwolf configuration file. Compiling
+    # this once means we don't look it up in re's cache every time we send a message.
+    BEACON_COMMENT_PATTERN = re.compile(r'comment="[^"]*"')
+
     __slots__ = ("gpio_pin", "config_path", "_stop_event", "message_worker_thread")
 
     def __init__(self, gpio_pin, config_path) -> None:
@@ -56,7 +60,9 @@ class Transmitter:
             found = False
             for i, line in enumerate(lines):
                 if line.startswith("PBEACON"):
-                    lines[i] = re.sub(r'comment="[^"]*"', f'comment="{new_comment}"', line)
+                    lines[i] = Transmitter.BEACON_COMMENT_PATTERN.sub(
+                        f'comment="{new_comment}"', line
+                    )
                     found = True
                     break
 
@@ -71,7 +77,8 @@ class Transmitter:
         except FileNotFoundError:
             print("Configuration file not found.")
             return False
-        except Exception as e:
+        # A config file that isn't valid UTF-8 raises UnicodeDecodeError, which is a ValueError
+        except (OSError, ValueError) as e:
             print(f"Error updating configuration: {e}")
             return False
 
@@ -25,7 +25,6 @@ from payload.hardware.transmitter import Transmitter
 from payload.interfaces.base_imu import BaseIMU
 from payload.interfaces.base_receiver import BaseReceiver
 from payload.mock.display import FlightDisplay
-from payload.mock.mock_imu import MockIMU
 from payload.mock.mock_logger import MockLogger
 from payload.mock.mock_receiver import MockReceiver
 from payload.payload import PayloadContext
@@ -47,7 +46,7 @@ def run_mock_flight() -> None:
 
 
 def run_flight(args: argparse.Namespace) -> None:
-    mock_time_start = time.time()
+    mock_time_start = time.monotonic()
 
     imu, logger, data_processor, transmitter, receiver = create_components(args)
     # Initialize the payload context and display
@@ -68,12 +67,17 @@ def create_components(
     :return: A tuple containing the IMU, Logger, and data processor objects
     """
     if args.mock:
+        # We only import the MockIMU when it is used, since it pulls in pandas, which takes a long
+        # time to import on the Pi
+        from payload.mock.mock_imu import MockIMU
+
         # Replace hardware with mock objects for mock replay
         imu = (
             IMU(ARDUINO_SERIAL_PORT, ARDUINO_BAUD_RATE)
             if args.real_imu
             else MockIMU(
                 log_file_path=args.path,
+                fast_replay=args.fast_replay,
             )
         )
         logger = MockLogger(LOGS_PATH, delete_log_file=not args.keep_log_file)
@@ -49,7 +49,7 @@ class FlightDisplay:
     ) -> None:
         """
         :param payload: The PayloadContext object.
-        :param start_time: The time (in seconds) the replay started.
+        :param start_time: The time (in seconds, from time.monotonic) the replay started.
         """
         init(autoreset=True)  # Automatically reset colors after each print
         self._payload = payload
@@ -134,7 +134,7 @@ class FlightDisplay:
         output = [
             f"{Y}{'=' * 15} {'REPLAY' if self._args.mock else 'STANDBY'} INFO {'=' * 15}{RESET}",
             f"Replay file:                  {C}{self._launch_file}{RESET}",
-            f"Time since replay start:      {C}{time.time() - self._start_time:<10.2f}{RESET} {R}s{RESET}",  # noqa: E501
+            f"Time since replay start:      {C}{time.monotonic() - self._start_time:<10.2f}{RESET} {R}s{RESET}",  # noqa: E501
             f"{Y}{'=' * 12} REAL TIME FLIGHT DATA {'=' * 12}{RESET}",
             # Format time as MM:SS:
             f"Launch time:               {G}T+{time.strftime('%M:%S', time.gmtime(time_since_launch))}{RESET}",  # noqa: E501
@@ -1,8 +1,11 @@
 """Module for simulating interacting with the IMU (Inertial measurement unit) on the rocket."""
 
+import csv
+import math
 import time
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from payload.constants import FREQUENCY
@@ -16,34 +19,53 @@ class MockIMU(BaseIMU):
     and returns one row at a time as an IMUDataPacket at a fixed rate of 50Hz.
     """
 
-    __slots__ = ("_current_index", "_df", "_last_fetch_time", "_log_file_path", "is_running")
+    __slots__ = (
+        "_columns",
+        "_fast_replay",
+        "_last_fetch_time",
+        "_log_file_path",
+        "_rows",
+        "is_running",
+    )
 
-    def __init__(self, log_file_path: Path | None = None) -> None:
+    def __init__(self, log_file_path: Path | str | None = None, fast_replay: bool = False) -> None:
         """
         Initializes the MockIMU by loading data from the given CSV file.
         :param log_file_path: Path to the CSV file containing mock IMU data.
+        :param fast_replay: Whether to return the rows as fast as they are asked for, instead of
+            at the rate of the real IMU.
         """
-        self._log_file_path = log_file_path
         if log_file_path is None:
             # If no log file path is provided, use the default log file path
             root_dir = Path(__file__).parent.parent.parent
             self._log_file_path = next(iter(Path(root_dir / "launch_data").glob("*.csv")))
-        # We iterate through the CSV file using pandas, making one row into a data packet at a time
-        self._data = pd.read_csv(self._log_file_path)
-        self._current_index = 0
+        else:
+            # Accept plain strings too, since we open the file through Path below
+            self._log_file_path = Path(log_file_path)
+        self._fast_replay = fast_replay
         self._last_fetch_time = 0
         self.is_running = True
 
-        # Using pandas and itertuples to read the header:
-        df_header = pd.read_csv(self._log_file_path, nrows=0)
+        # We only need the header row to know the columns, so we read it with the csv module
+        # instead of having pandas parse the file
+        with self._log_file_path.open(newline="") as file:
+            header = next(csv.reader(file))
         # Get the columns that are common between the data packet and the log file, since we only
-        # care about those
-        self._valid_columns = list((set(IMUDataPacket.__struct_fields__)) & set(df_header.columns))
-        self._df = pd.read_csv(
+        # care about those. This keeps them in the same order as the log file.
+        self._valid_columns = [
+            column for column in header if column in IMUDataPacket.__struct_fields__
+        ]
+        # This is the only time the whole CSV file is parsed, we only load the columns we need
+        df = pd.read_csv(
             self._log_file_path,
             engine="c",
             usecols=self._valid_columns,
         )
+        # Reading a row of a numpy array is much cheaper than building a pandas Series with
+        # iloc every fetch, so we convert the data once here, and step through its rows with an
+        # iterator
+        self._rows = iter(df.to_numpy(dtype=np.float64))
+        self._columns = tuple(df.columns)
 
     def start(self) -> None:
         """Starts the IMU."""
@@ -55,24 +77,30 @@ class MockIMU(BaseIMU):
 
     def fetch_data(self) -> IMUDataPacket | None:
         """
-        Returns the next row of the CSV as an IMUDataPacket at a rate of 50Hz.
-        If called too soon, it returns None.
+        Returns the next row of the CSV as an IMUDataPacket at a rate of 50Hz, or on every call
+        when fast replay is on. If called too soon, it returns None.
         :return: IMUDataPacket or None if not enough time has passed.
         """
-        current_time = time.time()
-        # We simulate the delay the real imu has in sending data by checking the time that has
-        # passed since the last fetch.
-        if current_time - self._last_fetch_time < 1 / FREQUENCY:  # 50Hz = 20ms
-            return None  # Skip this call if 20ms hasn't passed
+        # In fast replay we don't need to wait between fetches, so we skip reading the clock
+        if not self._fast_replay:
+            # The monotonic clock is used since we only care about the time between fetches,
+            # and it can't jump around if the system clock gets adjusted
+            current_time = time.monotonic()
+            # We simulate the delay the real imu has in sending data by checking the time that
+            # has passed since the last fetch.
+            if current_time - self._last_fetch_time < 1 / FREQUENCY:  # 50Hz = 20ms
+                return None  # Skip this call if 20ms hasn't passed
+            self._last_fetch_time = current_time
 
+        row = next(self._rows, None)
         # If we have reached the end of the data, stop the IMU
-        if self._current_index >= len(self._data):
+        if row is None:
             self.stop()
             return None
 
-        row = self._df.iloc[self._current_index]
-        row_dict = {k: v for k, v in row.items() if pd.notna(v)}
-        self._current_index += 1
-        self._last_fetch_time = current_time
+        # Empty cells in the CSV are NaN, we leave those fields as their default
+        row_dict = {
+            k: v for k, v in zip(self._columns, row.tolist(), strict=True) if not math.isnan(v)
+        }
         # Converts a row in the CSV to an IMUDataPacket
         return IMUDataPacket(**row_dict)
@@ -1,6 +1,7 @@
 """File which contains a few basic utility functions which can be reused in the project."""
 
 import argparse
+import math
 from functools import partial
 import subprocess
 from pathlib import Path
@@ -64,6 +65,80 @@ def deadband(input_value: float, threshold: float) -> float:
     return input_value
 
 
+def quaternion_multiply(
+    q1: tuple[float, float, float, float], q2: tuple[float, float, float, float]
+) -> tuple[float, float, float, float]:
+    """
+    Multiplies two quaternions using the Hamilton product. The resulting rotation is the same as
+    applying q2 first and then q1. Quaternions are in scalar first order (w, x, y, z).
+    :param q1: The quaternion on the left side of the product.
+    :param q2: The quaternion on the right side of the product.
+    :return: The product of the two quaternions.
+    """
+    w1, x1, y1, z1 = q1
+    w2, x2, y2, z2 = q2
+    return (
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    )
+
+
+def normalize_quaternion(
+    quaternion: tuple[float, float, float, float],
+) -> tuple[float, float, float, float]:
+    """
+    Scales a quaternion to unit length, so that it represents a pure rotation.
+    :param quaternion: The quaternion to normalize, in scalar first order (w, x, y, z).
+    :return: The unit quaternion.
+    """
+    w, x, y, z = quaternion
+    norm = math.sqrt(w * w + x * x + y * y + z * z)
+    return w / norm, x / norm, y / norm, z / norm
+
+
+def rotation_vector_to_quaternion(
+    rotation_vector: tuple[float, float, float],
+) -> tuple[float, float, float, float]:
+    """
+    Converts a rotation vector (axis multiplied by the angle in radians) to a unit quaternion.
+    :param rotation_vector: The rotation vector to convert.
+    :return: The equivalent quaternion, in scalar first order (w, x, y, z).
+    """
+    x, y, z = rotation_vector
+    angle = math.sqrt(x * x + y * y + z * z)
+    # sin(angle / 2) / angle is 0 / 0 for tiny angles, so we use its Taylor series instead
+    if angle <= 1e-3:
+        angle_squared = angle * angle
+        scale = 0.5 - angle_squared / 48 + angle_squared * angle_squared / 3840
+    else:
+        scale = math.sin(angle / 2) / angle
+    return math.cos(angle / 2), x * scale, y * scale, z * scale
+
+
+def rotate_vector(
+    quaternion: tuple[float, float, float, float], vector: tuple[float, float, float]
+) -> tuple[float, float, float]:
+    """
+    Rotates a vector by a unit quaternion.
+    :param quaternion: The unit quaternion to rotate by, in scalar first order (w, x, y, z).
+    :param vector: The vector to rotate.
+    :return: The rotated vector.
+    """
+    w, qx, qy, qz = quaternion
+    vx, vy, vz = vector
+    # v' = v + w * t + q_xyz x t, where t = 2 * (q_xyz x v)
+    tx = 2 * (qy * vz - qz * vy)
+    ty = 2 * (qz * vx - qx * vz)
+    tz = 2 * (qx * vy - qy * vx)
+    return (
+        vx + w * tx + qy * tz - qz * ty,
+        vy + w * ty + qz * tx - qx * tz,
+        vz + w * tz + qx * ty - qy * tx,
+    )
+
+
 def arg_parser(mock_invocation: bool = False) -> argparse.Namespace:
     """Handles the command line arguments for the main payload script.
 
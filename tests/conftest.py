@@ -0,0 +1,52 @@
+"""Module where fixtures are shared between all test files."""
+
+from collections import deque
+from typing import TYPE_CHECKING, Self
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FakeSerial:
+    """
+    Stands in for a serial.Serial port. Bytes are handed out in the chunks they were fed in, so
+    tests can control exactly how data is split across reads.
+    """
+
+    __slots__ = ("_chunks", "on_empty")
+
+    def __init__(self) -> None:
+        self._chunks: deque[bytes] = deque()
+        # Called when a read finds no data, which is when a real port would time out
+        self.on_empty: Callable[[], None] | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def feed(self, *chunks: bytes) -> None:
+        """Queues up chunks of bytes to be read."""
+        self._chunks.extend(chunks)
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._chunks[0]) if self._chunks else 0
+
+    def read(self, size: int = 1) -> bytes:
+        if not self._chunks:
+            if self.on_empty:
+                self.on_empty()
+            return b""
+        chunk = self._chunks.popleft()
+        if len(chunk) > size:
+            self._chunks.appendleft(chunk[size:])
+        return chunk[:size]
+
+
+@pytest.fixture
+def fake_serial():
+    return FakeSerial()
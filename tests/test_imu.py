@@ -0,0 +1,79 @@
+"""Tests for reading data packets from the Arduino in payload/hardware/imu.py."""
+
+import struct
+
+import pytest
+
+from payload.constants import PACKET_BYTE_SIZE, PACKET_START_MARKER
+from payload.hardware.imu import IMU
+
+# A float whose bytes are all the start marker, to check it isn't mistaken for a new packet
+MARKER_FLOAT = struct.unpack("<f", PACKET_START_MARKER * 4)[0]
+
+
+def make_packet(timestamp: int) -> bytes:
+    """Builds the bytes the Arduino sends for one packet, including the start marker."""
+    values = [float(timestamp), MARKER_FLOAT] + [float(i) for i in range(PACKET_BYTE_SIZE // 4 - 2)]
+    return PACKET_START_MARKER + IMU.PACKET_STRUCT.pack(*values)
+
+
+@pytest.fixture
+def imu(fake_serial):
+    imu = IMU("/dev/null", 115200)
+    imu._serial = fake_serial
+    return imu
+
+
+def fetch_timestamps(imu: IMU, calls: int) -> list[float | None]:
+    """Calls fetch_data a number of times and returns the timestamps it got, or None."""
+    packets = [imu.fetch_data() for _ in range(calls)]
+    return [packet.timestamp if packet else None for packet in packets]
+
+
+class TestIMU:
+    """Tests how the IMU finds packets in the stream of bytes from the serial port."""
+
+    def test_no_data(self, imu):
+        assert imu.fetch_data() is None
+
+    def test_single_packet(self, imu, fake_serial):
+        fake_serial.feed(make_packet(1))
+        packet = imu.fetch_data()
+        assert packet.timestamp == 1
+        assert packet.voltage == MARKER_FLOAT
+        assert packet.ambientTemperature == 0.0
+        assert packet.gpsAltitude == PACKET_BYTE_SIZE // 4 - 3
+
+    def test_leading_garbage_is_skipped(self, imu, fake_serial):
+        fake_serial.feed(b"\x01\x02garbage" + make_packet(1))
+        assert fetch_timestamps(imu, 2) == [1, None]
+
+    def test_garbage_without_marker_is_dropped(self, imu, fake_serial):
+        fake_serial.feed(b"no marker in here")
+        assert imu.fetch_data() is None
+        assert not imu._buffer
+        fake_serial.feed(make_packet(2))
+        assert fetch_timestamps(imu, 1) == [2]
+
+    def test_packet_split_across_reads(self, imu, fake_serial):
+        packet = make_packet(1)
+        fake_serial.feed(packet[:1])
+        assert imu.fetch_data() is None
+        fake_serial.feed(packet[1:40])
+        assert imu.fetch_data() is None
+        fake_serial.feed(packet[40:])
+        assert fetch_timestamps(imu, 2) == [1, None]
+
+    def test_several_packets_in_one_read(self, imu, fake_serial):
+        fake_serial.feed(make_packet(1) + make_packet(2) + make_packet(3))
+        assert fetch_timestamps(imu, 4) == [1, 2, 3, None]
+
+    def test_mixed_stream_keeps_packets_in_order(self, imu, fake_serial):
+        """Garbage, split packets and a leftover tail should still give every packet in order."""
+        stream = b"\x00\x13" + make_packet(1) + make_packet(2) + make_packet(3) + make_packet(4)
+        # Split the stream at points that don't line up with the packets
+        fake_serial.feed(stream[:50], stream[50:100], stream[100:101], stream[101:300])
+        fake_serial.feed(stream[300:])
+        timestamps = [timestamp for timestamp in fetch_timestamps(imu, 12) if timestamp]
+        assert timestamps == [1, 2, 3, 4]
+        assert not imu._buffer
@@ -0,0 +1,54 @@
+"""Tests for reading messages from the XBee in payload/hardware/receiver.py."""
+
+import pytest
+
+from payload.constants import NO_MESSAGE
+from payload.hardware import receiver as receiver_module
+from payload.hardware.receiver import Receiver
+
+
+@pytest.fixture
+def receiver(fake_serial, monkeypatch):
+    receiver = Receiver("/dev/null", 9600)
+    monkeypatch.setattr(receiver_module.serial, "Serial", lambda *_, **__: fake_serial)
+    # Once everything fed in has been read, stop the listening loop
+    fake_serial.on_empty = receiver._stop_event.set
+    return receiver
+
+
+def received_messages(output: str) -> list[str]:
+    """Gets the messages the receiver printed when its message changed."""
+    prefix = "Received: "
+    return [line.removeprefix(prefix) for line in output.splitlines() if line.startswith(prefix)]
+
+
+class TestReceiver:
+    """Tests how the receiver splits the bytes from the serial port into messages."""
+
+    def test_no_data(self, receiver):
+        receiver._listen()
+        assert receiver.latest_message == NO_MESSAGE
+
+    def test_message_split_across_reads(self, receiver, fake_serial, capsys):
+        fake_serial.feed(b"TRANS", b"MI", b"T\n")
+        receiver._listen()
+        assert receiver.latest_message == "TRANSMIT"
+        assert received_messages(capsys.readouterr().out) == ["TRANSMIT"]
+
+    def test_partial_line_is_not_a_message(self, receiver, fake_serial):
+        fake_serial.feed(b"TRANSMIT\nST")
+        receiver._listen()
+        assert receiver.latest_message == "TRANSMIT"
+
+    def test_messages_in_order(self, receiver, fake_serial, capsys):
+        """Several lines per read, repeats, blank lines and CRLF endings should give each change
+        of message once, in order."""
+        fake_serial.feed(b"TRANSMIT\r\nTRANSMIT\nSTO", b"P\n\nSTOP\n", b"TRANSMIT\n", b"\n")
+        receiver._listen()
+        assert receiver.latest_message == "TRANSMIT"
+        assert received_messages(capsys.readouterr().out) == ["TRANSMIT", "STOP", "TRANSMIT"]
+
+    def test_invalid_utf8_is_ignored(self, receiver, fake_serial):
+        fake_serial.feed(b"ST\xffOP\n")
+        receiver._listen()
+        assert receiver.latest_message == "STOP"
@@ -0,0 +1,96 @@
+"""Tests for the helper functions in payload/utils.py."""
+
+import math
+
+import pytest
+
+from payload.utils import (
+    normalize_quaternion,
+    quaternion_multiply,
+    rotate_vector,
+    rotation_vector_to_quaternion,
+)
+
+IDENTITY = (1.0, 0.0, 0.0, 0.0)
+HALF_SQRT_2 = math.sqrt(2) / 2
+
+
+class TestQuaternionMath:
+    """Tests the quaternion helpers the data processor uses to track the rocket's orientation."""
+
+    def test_identity(self):
+        """A zero rotation vector is the identity, and the identity changes nothing."""
+        assert rotation_vector_to_quaternion((0.0, 0.0, 0.0)) == IDENTITY
+        q = normalize_quaternion((0.3, -0.1, 0.7, 0.2))
+        assert quaternion_multiply(IDENTITY, q) == pytest.approx(q)
+        assert quaternion_multiply(q, IDENTITY) == pytest.approx(q)
+        assert rotate_vector(IDENTITY, (1.5, -2.0, 9.8)) == pytest.approx((1.5, -2.0, 9.8))
+
+    def test_normalize_quaternion(self):
+        assert normalize_quaternion((2.0, 0.0, 0.0, 0.0)) == pytest.approx(IDENTITY)
+        assert normalize_quaternion((1.0, 1.0, 1.0, 1.0)) == pytest.approx((0.5, 0.5, 0.5, 0.5))
+
+    @pytest.mark.parametrize(
+        ("rotation_vector", "expected_quaternion", "vector", "expected_vector"),
+        [
+            ((math.pi / 2, 0, 0), (HALF_SQRT_2, HALF_SQRT_2, 0, 0), (0, 1, 0), (0, 0, 1)),
+            ((0, math.pi / 2, 0), (HALF_SQRT_2, 0, HALF_SQRT_2, 0), (0, 0, 1), (1, 0, 0)),
+            ((0, 0, math.pi / 2), (HALF_SQRT_2, 0, 0, HALF_SQRT_2), (1, 0, 0), (0, 1, 0)),
+        ],
+        ids=["x", "y", "z"],
+    )
+    def test_90_degrees_about_each_axis(
+        self, rotation_vector, expected_quaternion, vector, expected_vector
+    ):
+        """Tests the quaternion for a 90 degree rotation, and that it turns the axes the right
+        way (right-handed)."""
+        q = rotation_vector_to_quaternion(rotation_vector)
+        assert q == pytest.approx(expected_quaternion, abs=1e-12)
+        assert rotate_vector(q, vector) == pytest.approx(expected_vector, abs=1e-12)
+
+    @pytest.mark.parametrize(
+        "rotation_vector",
+        [(1e-4, -2e-4, 5e-5), (0.0, 0.0, 1e-3), (3e-7, 1e-8, -4e-7)],
+        ids=["small", "at_threshold", "tiny"],
+    )
+    def test_small_angle_taylor_series(self, rotation_vector):
+        """Small angles use a Taylor series for sin(angle / 2) / angle, which should match the
+        exact formula."""
+        x, y, z = rotation_vector
+        angle = math.sqrt(x * x + y * y + z * z)
+        scale = math.sin(angle / 2) / angle
+        expected = (math.cos(angle / 2), x * scale, y * scale, z * scale)
+        q = rotation_vector_to_quaternion(rotation_vector)
+        assert q == pytest.approx(expected, rel=1e-15, abs=1e-18)
+        assert math.fsum(c * c for c in q) == pytest.approx(1.0, abs=1e-15)
+
+    def test_taylor_series_is_continuous_at_threshold(self):
+        """The two branches should agree on either side of the small angle threshold."""
+        below = rotation_vector_to_quaternion((1e-3, 0.0, 0.0))
+        above = rotation_vector_to_quaternion((math.nextafter(1e-3, 1.0), 0.0, 0.0))
+        assert below == pytest.approx(above, abs=1e-15)
+
+    def test_composition_order(self):
+        """quaternion_multiply(current, delta) applies delta first, in the rocket's frame, and
+        then current. This is how the data processor adds each new gyro reading."""
+        current = rotation_vector_to_quaternion((0, 0, math.pi / 2))
+        delta = rotation_vector_to_quaternion((math.pi / 2, 0, 0))
+
+        composed = quaternion_multiply(current, delta)
+        assert composed == pytest.approx((0.5, 0.5, 0.5, 0.5))
+        # The other order is a different rotation
+        assert quaternion_multiply(delta, current) == pytest.approx((0.5, 0.5, -0.5, 0.5))
+
+        vector = (0.0, 1.0, 0.0)
+        expected = rotate_vector(current, rotate_vector(delta, vector))
+        assert expected == pytest.approx((0.0, 0.0, 1.0), abs=1e-12)
+        assert rotate_vector(composed, vector) == pytest.approx(expected, abs=1e-12)
+
+    def test_many_compositions_stay_a_rotation(self):
+        """Composing many small rotations about one axis should add up to the total angle."""
+        q = IDENTITY
+        step = rotation_vector_to_quaternion((0.0, 0.0, 2 * math.pi / 100_000))
+        for _ in range(25_000):
+            q = quaternion_multiply(q, step)
+        assert q == pytest.approx(rotation_vector_to_quaternion((0, 0, math.pi / 2)), abs=1e-9)
+        assert rotate_vector(q, (1.0, 0.0, 0.0)) == pytest.approx((0.0, 1.0, 0.0), abs=1e-9)